@@ -25,7 +25,7 @@
           path = ./.;
           propagatedBuildInputs = with python.pkgs; [
             pillow
-            fuzzywuzzy
+            rapidfuzz
             aiosqlite
             pylast
             discord-ext-menus
@@ -19,6 +19,10 @@ def flip_avatar(input_buffer):
     with BytesIO() as buffer:
         with Image.open(input_buffer) as image:
             image = image.transpose(Image.FLIP_TOP_BOTTOM)
+            if image.mode == "RGBA" and image.getextrema()[3] == (255, 255):
+                # the avatar is fully opaque, so drop the alpha channel to
+                # give zlib one less band to compress
+                image = image.convert("RGB")
             image.save(buffer, "png")
 
         return buffer.getvalue()
@@ -1,4 +1,6 @@
 import datetime
+import re
+
 import discord
 from discord.ext import commands
 
@@ -8,6 +10,15 @@ from lifesaver.utils.formatting import human_delta
 
 LASTFM_COLOR = discord.Color(0xB90000)
 
+#: Precompiled markdown escaper. ``discord.utils.escape_markdown`` builds its
+#: substitution machinery on every call, which adds up when formatting a track
+#: listing.
+_MD_ESCAPE = re.compile(r"([\\_*~`|>])")
+
+
+def _escape_markdown(text: str) -> str:
+    return _MD_ESCAPE.sub(r"\\\1", text)
+
 
 class LastFMConfig(lifesaver.config.Config):
     name: str
@@ -72,11 +83,9 @@ class LastFM(lifesaver.Cog, name="Last.fm"):
             return format_track(track) + f" ({delta})"
 
         def format_track(track):
-            return discord.utils.escape_markdown(
-                f"{track.artist} \N{em dash} {track.title}"
-            )
+            return _escape_markdown(f"{track.artist} \N{em dash} {track.title}")
 
-        tracks = "\n".join(format_played_track(track) for track in user["tracks"][:5])
+        tracks = "\n".join([format_played_track(track) for track in user["tracks"][:5]])
 
         embed = discord.Embed(
             title=f'@{user["user"].get_name()}',
@@ -104,12 +113,12 @@ class LastFM(lifesaver.Cog, name="Last.fm"):
 
         def format_item(item):
             track = item.item
-            track_description = discord.utils.escape_markdown(
+            track_description = _escape_markdown(
                 f"{track.artist} \N{em dash} {track.title}"
             )
             return f"{track_description} ({item.weight} plays)"
 
-        favs = "\n".join(format_item(fav) for fav in user["top_tracks"])
+        favs = "\n".join([format_item(fav) for fav in user["top_tracks"]])
 
         embed = discord.Embed(
             title=f'@{user["user"].get_name()}',
@@ -5,6 +5,7 @@ from typing import (
     Any,
     Dict,
     Optional,
+    Set,
     Union,
     cast,
 )
@@ -16,10 +17,13 @@ from discord.ext.commands._types import BotT
 import lifesaver
 from lifesaver.utils.formatting import Table, codeblock
 
-from .game import MafiaGame
+from .game import MafiaGame, created_guild_ids
 
 Listener = Callable[..., Coroutine[Any, Any, None]]
 
+_ADMIN_PERMS = discord.Permissions(administrator=True)
+_DEBUG_ROLE_COLOR = discord.Color.blue()
+
 
 class GameConverter(commands.Converter[MafiaGame]):
     async def convert(self, ctx: commands.Context[BotT], argument: str) -> MafiaGame:
@@ -55,13 +59,24 @@ class Mafia(lifesaver.Cog):
         super().__init__(bot)
         self.sessions: Dict[int, MafiaGame] = {}
 
+        #: Games indexed by their game guild's ID. Since a game's guild is
+        #: only created after its session is registered, this is populated
+        #: lazily the first time a guild resolves to a game.
+        self._games_by_guild: Dict[int, MafiaGame] = {}
+
     def get_game(
         self, ctx: Union[lifesaver.Context, discord.Guild]
     ) -> Optional[MafiaGame]:
         """Return the game according to the current context, or the game's guild."""
 
         if isinstance(ctx, discord.Guild):
-            return discord.utils.get(self.sessions.values(), guild=ctx)
+            if (game := self._games_by_guild.get(ctx.id)) is not None:
+                return game
+
+            game = discord.utils.get(self.sessions.values(), guild=ctx)
+            if game is not None:
+                self._games_by_guild[ctx.id] = game
+            return game
 
         if (game := self.sessions.get(ctx.channel.id)) is None:
             # since we're unable to fetch the game from the lobby channel, try
@@ -172,7 +187,9 @@ class Mafia(lifesaver.Cog):
           usernames very loosely and the bot will likely figure out who you
           wanted to choose.
         """
-        if ctx.channel.id in self.sessions:
+        channel_id = ctx.channel.id
+
+        if channel_id in self.sessions:
             await ctx.send("A game has already been started here...!")
             return
 
@@ -182,7 +199,6 @@ class Mafia(lifesaver.Cog):
 
         creator = cast(discord.Member, ctx.author)
         lobby_channel = cast(discord.TextChannel, ctx.channel)
-        channel_id = ctx.channel.id
 
         game = MafiaGame(ctx.bot, creator=creator, lobby_channel=lobby_channel, ctx=ctx)
         self.sessions[channel_id] = game
@@ -194,6 +210,8 @@ class Mafia(lifesaver.Cog):
             self.log.exception("error during mafia")
         finally:
             del self.sessions[channel_id]
+            if (guild := game.guild) is not None:
+                self._games_by_guild.pop(guild.id, None)
 
     @mafia.command(name="roles")
     async def mafia_roles(self, ctx: lifesaver.Context) -> None:
@@ -272,9 +290,22 @@ class Mafia(lifesaver.Cog):
     @commands.is_owner()
     async def mafia_debug_clean(self, ctx: lifesaver.Context) -> None:
         """Deletes any created Mafia guilds"""
-        for guild in ctx.bot.guilds:
+        cleaned: Set[int] = set()
+
+        # guilds created by this process are tracked directly
+        for guild_id in list(created_guild_ids):
+            if (guild := ctx.bot.get_guild(guild_id)) is not None:
+                await guild.delete()
+                cleaned.add(guild_id)
+            created_guild_ids.discard(guild_id)
+
+        # fall back to a name scan for strays left over from previous runs
+        for guild in list(ctx.bot.guilds):
+            if guild.id in cleaned:
+                continue
             if "mafia " in guild.name and guild.owner == ctx.bot.user:
                 await guild.delete()
+
         await ctx.ok()
 
     @mafia_debug.command(name="stop")
@@ -299,10 +330,8 @@ class Mafia(lifesaver.Cog):
             await ctx.send("Game area not found.")
             return
 
-        permissions = discord.Permissions(administrator=True)
-
         role = await guild.create_role(
-            name="debug admin", permissions=permissions, color=discord.Color.blue()
+            name="debug admin", permissions=_ADMIN_PERMS, color=_DEBUG_ROLE_COLOR
         )
         await cast(discord.Member, ctx.author).add_roles(role)
         await ctx.ok()
@@ -3,38 +3,42 @@ __all__ = ["user_listing", "msg", "Message"]
 import random
 from typing import Any, Union, List, Iterable, TYPE_CHECKING
 
-import discord
-
 if TYPE_CHECKING:
     from .player import Player
     from .utils import UserLikeIterable
 
 Message = Union[str, List[str]]
 
+_BULLET = "\N{WHITE SMALL SQUARE} "
+
 
 def user_listing(
     users: Union["UserLikeIterable", Iterable["Player"]], *, commas: bool = False
 ) -> str:
     """Format a list of users."""
+    names = list(map(str, users))
     if commas:
-        return ", ".join(map(str, users))
-    return "\n".join(f"\N{WHITE SMALL SQUARE} {user}" for user in users)
+        return ", ".join(names)
+    if not names:
+        return ""
+    # one concatenation plus a single join over already-stringified names,
+    # instead of an f-string interpolation per user
+    return _BULLET + ("\n" + _BULLET).join(names)
 
 
 def msg(message: Message, **kwargs: Any) -> str:
     """Process a message, randomly choosing from it if it's a ``list``."""
     if isinstance(message, list):
         message = random.choice(message)
-    return message.format(**kwargs)
+    if not kwargs:
+        # nothing to substitute, so skip the template parser entirely
+        return message
+    return message.format_map(kwargs)
 
 
 def mention_set(entities: Union["UserLikeIterable", Iterable["Player"]]) -> str:
     """Format a list of mentions from a list of users."""
-
-    def mention(entity: Union[discord.User, discord.Member, "Player"]) -> str:
-        if isinstance(entity, (discord.User, discord.Member)):
-            return entity.mention
-        else:
-            return entity.member.mention
-
-    return ", ".join(mention(entity) for entity in entities)
+    # players and user-like objects both expose a mention property, so no
+    # per-entity type dispatch is necessary. a list comprehension lets join
+    # size its result up front instead of draining a generator
+    return ", ".join([entity.mention for entity in entities])
@@ -10,11 +10,10 @@ import random
 from typing import (
     cast,
     Any,
-    AsyncGenerator,
     Dict,
+    List,
     Optional,
     Set,
-    Type,
     Union,
     Iterator,
 )
@@ -28,15 +27,39 @@ from . import messages
 from . import role
 from .permissions import ALLOW, BLOCK, HUSH, HUSH_PERMS, NEUTRAL_HUSH_PERMS
 from .player import Player
-from .role import AnyRoleType, Role, RoleActionContext
+from .role import AnyRoleType, RoleActionContext
 from .roster import Roster
 from .lobby import LobbyMenu
 from .memory import Memory, Key
-from .utils import basic_command
+from .utils import basic_command, BucketLimiter
 from .formatting import mention_set, user_listing, msg
 from .voting import trial_and_judgement_loop
 
 
+#: The IDs of every game guild created by this process. Lets the debug
+#: cleanup command delete its guilds directly instead of name-scanning every
+#: guild the bot is in.
+created_guild_ids: Set[int] = set()
+
+#: The restricted default permission set for game guilds, so that people
+#: can't cause any trouble. Built once at import instead of flag by flag
+#: during every game setup.
+_BASE_PERMISSIONS = discord.Permissions(
+    # voice
+    stream=True,
+    speak=True,
+    use_voice_activation=True,
+    # messages
+    add_reactions=True,
+    read_messages=True,
+    send_messages=True,
+    embed_links=True,
+    attach_files=True,
+    external_emojis=True,
+    read_message_history=True,
+)
+
+
 class MafiaGameState(enum.Enum):
     """A :class:`enum.Enum` representing possible game states."""
 
@@ -64,6 +87,10 @@ class MafiaGame:
         role.Medium: 5,
     }
 
+    # split out once so each draw doesn't have to rebuild them
+    _WEIGHTED_ROLE_CHOICES = list(WEIGHTED_ROLES.keys())
+    _WEIGHTED_ROLE_WEIGHTS = list(WEIGHTED_ROLES.values())
+
     def __init__(
         self,
         bot: lifesaver.Bot,
@@ -81,6 +108,11 @@ class MafiaGame:
         #: server.
         self.participants: Set[discord.Member] = {creator}
 
+        #: The IDs of every participant. Frozen once the lobby closes;
+        #: membership checks against members of the game guild go through
+        #: this instead of comparing member objects across guilds.
+        self._participant_ids: Set[int] = set()
+
         #: The game roster. Stores the full list of active players.
         self.roster: Optional[Roster] = None
 
@@ -110,9 +142,6 @@ class MafiaGame:
         #: night.
         self.memory = Memory()
 
-        #: The lock for role states.
-        self._memory_lock = asyncio.Lock()
-
         #: The guild where the game is taking place.
         self.guild: Optional[discord.Guild] = None
 
@@ -146,15 +175,43 @@ class MafiaGame:
         #: An event that is set when all players have joined the game guild.
         self._all_players_joined = asyncio.Event()
 
+        #: An event that is set whenever a player dies, so that long phase
+        #: waits can wake up early and re-check win conditions.
+        self._state_changed = asyncio.Event()
+
         #: The message that shows who still needs to join.
         self._filling_message: Optional[discord.Message] = None
 
+        #: The pending filling-message edit, if any. Edits are coalesced
+        #: through this task so a burst of joins doesn't fire one edit each.
+        self._filling_task: Optional[asyncio.Task[None]] = None
+
+        #: The participants who haven't joined the game guild yet, keyed by
+        #: ID. Maintained incrementally as joins come in, rather than being
+        #: recomputed from the full guild member list.
+        self._remaining_participants: Dict[int, discord.Member] = {}
+
         #: Whether we are handling nocturnal actions or not.
         self._handling_nocturnal_actions: bool = False
 
+        #: The IDs of every channel that commands can be used in (personal
+        #: channels and grouped role channels). Used to cheaply ignore
+        #: messages from every other channel in the guild.
+        self._command_channel_ids: Set[int] = set()
+
         #: The message showing the list of roles.
         self._role_listing_message: Optional[discord.Message] = None
 
+        #: Cached role listing text, keyed by ``show_players``. Only
+        #: invalidated when a player dies, instead of reformatting every
+        #: player on each send.
+        self._role_listing_cache: Dict[bool, str] = {}
+
+        #: The players in role listing order. The ordering never changes
+        #: after setup, so it's sorted once and reused whenever the listing
+        #: text needs to be re-rendered.
+        self._listing_order: Optional[List[Player]] = None
+
     #: Debugging mode. Shortens some wait times.
     DEBUG = False
 
@@ -182,7 +239,7 @@ class MafiaGame:
             await member.add_roles(self.dead_role)
             return
 
-        if member not in self.participants:
+        if member.id not in self._participant_ids:
             assert self.spectator_role is not None
             await member.add_roles(self.spectator_role)
             return
@@ -190,12 +247,13 @@ class MafiaGame:
         await member.add_roles(self.player_role)
         await self.grant_channel_access(member)
 
-        if all(participant in self.guild.members for participant in self.participants):
+        self._remaining_participants.pop(member.id, None)
+        if not self._remaining_participants:
             # everyone has joined!
             self._all_players_joined.set()
         else:
             # more still need to join...
-            await self._update_filling_message()
+            self._schedule_filling_update()
 
     async def on_member_remove(self, member: discord.Member) -> None:
         """Handle a game member leaving the guild."""
@@ -212,37 +270,21 @@ class MafiaGame:
 
     async def on_message(self, message: discord.Message) -> None:
         """Handle a message being sent in the guild."""
-        await self._handle_always_available_commands(message)
-
-        if self._handling_nocturnal_actions:
-            await self._handle_night_command(message)
+        if message.channel.id not in self._command_channel_ids:
+            # commands only work in personal and grouped role channels, so
+            # don't bother scanning the roster for any other message
+            return
 
-    async def _all_messages(self) -> AsyncGenerator[discord.Message, None]:
-        """Asynchronously iterate over all new messages in the guild."""
+        assert self.roster is not None
 
-        def check(message: discord.Message) -> bool:
-            return message.guild == self.guild
+        # resolve the author a single time for every downstream handler
+        if (player := self.roster.get_player(message.author)) is None:
+            return
 
-        while True:
-            yield await self.bot.wait_for("message", check=check)
+        await self._handle_always_available_commands(message, player)
 
-    async def _messages_in(
-        self,
-        channel: discord.TextChannel,
-        *,
-        by: Union[Set[discord.Member], discord.Member],
-    ) -> AsyncGenerator[discord.Message, None]:
-        """Asynchronously iterate over specific messages in the guild."""
-
-        def check(message: discord.Message) -> bool:
-            channel_cond = message.channel == channel
-            if isinstance(by, set):
-                return channel_cond and message.author in by
-            else:
-                return channel_cond and message.author == by
-
-        while True:
-            yield await self.bot.wait_for("message", check=check)
+        if self._handling_nocturnal_actions:
+            await self._handle_night_command(message, player)
 
     async def throw(self, thrower: Player) -> None:
         assert self.all_chat is not None
@@ -273,84 +315,72 @@ class MafiaGame:
         except discord.HTTPException as err:
             raise RuntimeError("failed to create guild") from err
 
-        # set default notifications to mentions only
+        created_guild_ids.add(guild.id)
+
+        # the notification setting and the default role touch different
+        # routes, so apply both in one round trip's worth of waiting
         http = self.bot.http  # type: ignore
-        await cast(HTTPClient, http).request(
-            Route("PATCH", "/guilds/{guild_id}", guild_id=guild.id),
-            json={"default_message_notifications": 1},
+        await asyncio.gather(
+            cast(HTTPClient, http).request(
+                Route("PATCH", "/guilds/{guild_id}", guild_id=guild.id),
+                json={"default_message_notifications": 1},
+            ),
+            guild.default_role.edit(permissions=_BASE_PERMISSIONS),
         )
 
-        # restrict the default set of permissions so that people can't cause
-        # any trouble...
-        base_permissions = discord.Permissions()
-        for permission in {
-            # voice
-            # "connect",
-            "stream",
-            "speak",
-            "use_voice_activation",
-            # messages
-            "add_reactions",
-            "read_messages",
-            "send_messages",
-            "embed_links",
-            "attach_files",
-            "external_emojis",
-            "read_message_history",
-        }:
-            setattr(base_permissions, permission, True)
-        await guild.default_role.edit(permissions=base_permissions)
-
         # refresh cache
         await asyncio.sleep(1)
         guild = self.guild = cast(discord.Guild, self.bot.get_guild(guild.id))
 
-        # rename the default category just for fun
+        # rename the default category and text channel just for fun, and
+        # delete voice-related stuff; none of these depend on each other
         first_category = guild.categories[0]
-        await first_category.edit(name="mafia")
-
-        # delete voice-related stuff
         voice_category = guild.categories[1]
-        await voice_category.delete()
-        await guild.voice_channels[0].delete()
 
         # use the default text channel as the game chat
         all_chat = self.all_chat = guild.text_channels[0]
-        await all_chat.edit(name="game-chat")
 
-        spectator_role = self.spectator_role = await guild.create_role(
-            name="spectator", color=discord.Color.dark_grey()
+        await asyncio.gather(
+            first_category.edit(name="mafia"),
+            voice_category.delete(),
+            guild.voice_channels[0].delete(),
+            all_chat.edit(name="game-chat"),
         )
-        dead_role = self.dead_role = await guild.create_role(
-            name="dead", color=discord.Color.dark_red(), hoist=True
-        )
-        player_role = self.player_role = await guild.create_role(
-            name="player", color=discord.Color.default(), hoist=True
+
+        # the roles don't depend on each other (their positions are fixed up
+        # afterwards), so create all three concurrently
+        spectator_role, dead_role, player_role = await asyncio.gather(
+            guild.create_role(name="spectator", color=discord.Color.dark_grey()),
+            guild.create_role(name="dead", color=discord.Color.dark_red(), hoist=True),
+            guild.create_role(
+                name="player", color=discord.Color.default(), hoist=True
+            ),
         )
+        self.spectator_role = spectator_role
+        self.dead_role = dead_role
+        self.player_role = player_role
         await spectator_role.edit(position=1)
         await dead_role.edit(position=2)
         await player_role.edit(position=3)
 
-        # apply overwrites
-        await all_chat.edit(overwrites={dead_role: HUSH, spectator_role: HUSH})
-
-        self.spectator_chat = await first_category.create_text_channel(
-            name="spec-chat",
-            overwrites={
-                guild.default_role: BLOCK,
-                spectator_role: ALLOW,
-                dead_role: ALLOW,
-            },
+        # both of these only depend on the roles existing, so apply the game
+        # chat overwrites while the spectator channel is being created
+        (_, self.spectator_chat) = await asyncio.gather(
+            all_chat.edit(overwrites={dead_role: HUSH, spectator_role: HUSH}),
+            first_category.create_text_channel(
+                name="spec-chat",
+                overwrites={
+                    guild.default_role: BLOCK,
+                    spectator_role: ALLOW,
+                    dead_role: ALLOW,
+                },
+            ),
         )
 
-    async def _handle_always_available_commands(self, message: discord.Message) -> None:
+    async def _handle_always_available_commands(
+        self, message: discord.Message, player: Player
+    ) -> None:
         """Handle commands that are always available."""
-        assert self.roster is not None
-        player = self.roster.get_player(message.author)
-
-        if player is None:
-            return
-
         will_text = basic_command("!will", message.content)
         if will_text:
             assert player.channel is not None
@@ -363,15 +393,10 @@ class MafiaGame:
                 player.will = will_text
             return
 
-    async def _handle_night_command(self, message: discord.Message) -> None:
+    async def _handle_night_command(
+        self, message: discord.Message, player: Player
+    ) -> None:
         """Handle commands from personal and grouped role channels at night."""
-        assert self.roster is not None
-
-        player = self.roster.get_player(message.author)
-
-        if player is None:
-            return
-
         if player.role.grouped and message.channel != self.role_chats[player.role]:
             # for a player in a grouped role, only allow processing when
             # speaking in the designated channel
@@ -379,7 +404,7 @@ class MafiaGame:
 
         # grab previous state
         prev_state = None
-        if (key := player.role.localized_key(player)) is not None:
+        if (key := player.memory_key) is not None:
             prev_state = self.memory.get(key)
 
         ctx = RoleActionContext(game=self, player=player, message=message)
@@ -388,8 +413,10 @@ class MafiaGame:
         # update role state from on_message if the state has changed
         if key is not None and new_state != prev_state:
             self.log.debug("updating %r to %r", key, new_state)
-            async with self._memory_lock:
-                self.memory[key] = new_state
+            # a bare dict store can't be interrupted between tasks, so no
+            # lock is needed here; one would only matter if a critical
+            # section spanned an await
+            self.memory[key] = new_state
 
     async def _nighttime(self) -> None:
         assert self.roster is not None
@@ -401,20 +428,26 @@ class MafiaGame:
         # dump the previous role state
         self.memory.reset()
 
-        def iter_nocturnal(*, priority_by: str) -> Iterator[Player]:
-            assert self.roster is not None
+        # the nocturnal set doesn't change within a night, so compute it once
+        # here and reuse it for both the begin and end passes (each pass still
+        # needs its own sort, since the listener priorities differ)
+        nocturnal = list(enumerate(self.roster.nocturnal))
 
+        def iter_nocturnal(*, priority_by: str) -> Iterator[Player]:
             # for players in grouped roles, only handle one player per grouped
             # role. this makes the event handlers only trigger once a night.
             handled_grouped_roles: Set[AnyRoleType] = set()
 
-            nocturnal = sorted(
-                self.roster.nocturnal,
-                key=lambda player: getattr(player.role, priority_by)._listener_priority,
-                reverse=True,
-            )
+            # decorate-sort-undecorate: look up each player's listener
+            # priority once instead of per comparison (the index breaks ties
+            # so players are never compared directly)
+            keyed = [
+                (getattr(player.role, priority_by)._listener_priority, index, player)
+                for (index, player) in nocturnal
+            ]
+            keyed.sort(reverse=True)
 
-            for player in nocturnal:
+            for (_, _, player) in keyed:
                 if player.role in handled_grouped_roles or player.dead:
                     continue
                 self.log.debug("%s: yielding", player)
@@ -423,7 +456,7 @@ class MafiaGame:
                     handled_grouped_roles.add(player.role)
 
         def get_state() -> Optional[Any]:
-            if (key := player.role.localized_key(player)) is not None:
+            if (key := player.memory_key) is not None:
                 return self.memory.get(key)
             return None
 
@@ -444,8 +477,10 @@ class MafiaGame:
         # be "carried out".
         self.log.debug("handling nocturnal actions")
         self._handling_nocturnal_actions = True
-        await asyncio.sleep(10 if self.DEBUG else 36)
-        self._handling_nocturnal_actions = False
+        try:
+            await self._phase_sleep(10 if self.DEBUG else 36)
+        finally:
+            self._handling_nocturnal_actions = False
 
         # now to carry out what decisions were made during the night...
         for player in iter_nocturnal(priority_by="on_night_end"):
@@ -468,24 +503,42 @@ class MafiaGame:
         assert self.all_chat is not None
         assert self.dead_role is not None
         assert self.spectator_role is not None
-        await self.all_chat.set_permissions(self.dead_role, **NEUTRAL_HUSH_PERMS)
-        await self.all_chat.set_permissions(self.spectator_role, **NEUTRAL_HUSH_PERMS)
+        # push both unhushes as a single edit of the channel's overwrite map
+        # instead of one PATCH per role
+        overwrites = self.all_chat.overwrites
+        for target in (self.dead_role, self.spectator_role):
+            overwrite = overwrites.get(target, discord.PermissionOverwrite())
+            overwrite.update(**NEUTRAL_HUSH_PERMS)
+            overwrites[target] = overwrite
+        await self.all_chat.edit(overwrites=overwrites)
 
     async def _notify_roles(self) -> None:
         """Notify everyone of their role in the game."""
         assert self.all_chat is not None
         assert self.roster is not None
 
+        greetings = []
         for player in self.roster.players:
             assert player.channel is not None
             if (greeting := messages.ROLE_GREETINGS.get(player.role.name)) is not None:
-                await player.channel.send(f"{player.mention}: {msg(greeting)}")
+                greetings.append(
+                    player.channel.send(f"{player.mention}: {msg(greeting)}")
+                )
 
         mafia_chat = self.role_chats[role.Mafia]
-        await mafia_chat.send(
-            msg(messages.MAFIA_GREET, flavor=msg(messages.MAFIA_GREET_FLAVOR))
+        greetings.append(
+            mafia_chat.send(
+                msg(messages.MAFIA_GREET, flavor=msg(messages.MAFIA_GREET_FLAVOR))
+            )
         )
 
+        # the greetings are independent of each other, so send them all at
+        # once instead of serializing the round trips
+        results = await asyncio.gather(*greetings, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.log.warning("failed to send a greeting: %r", result)
+
     async def grant_channel_access(self, member: discord.Member) -> None:
         """Grant a member access to the channels that they need access to."""
         assert self.roster is not None
@@ -493,11 +546,12 @@ class MafiaGame:
         player = self.roster.get_player(member.id)
         assert player is not None
         assert player.channel is not None
-        await player.channel.set_permissions(member, overwrite=ALLOW)
 
+        grants = [player.channel.set_permissions(member, overwrite=ALLOW)]
         if player.role.grouped:
             role_channel = self.role_chats[player.role]
-            await role_channel.set_permissions(member, overwrite=ALLOW)
+            grants.append(role_channel.set_permissions(member, overwrite=ALLOW))
+        await asyncio.gather(*grants)
 
     async def _lock(self) -> None:
         """Prevent anyone from sending messages in the game channel."""
@@ -573,6 +627,22 @@ class MafiaGame:
             color=(discord.Color.red() if player.role.evil else discord.Color.green()),
         )
 
+    async def _phase_sleep(self, seconds: float) -> None:
+        """Sleep for a phase's duration, but wake up early if a player dies.
+
+        Without this, a win condition reached mid-phase (e.g. through a debug
+        slay) wouldn't end the game until the full phase timer ran out.
+        """
+        deadline = self.bot.loop.time() + seconds
+
+        while (remaining := deadline - self.bot.loop.time()) > 0:
+            try:
+                await asyncio.wait_for(self._state_changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+            self._state_changed.clear()
+            await self._check_game_over()
+
     async def _check_game_over(self) -> None:
         assert self.roster is not None
 
@@ -604,7 +674,7 @@ class MafiaGame:
         discussion_time = 5 if self.DEBUG else 45
 
         await self.all_chat.send(msg(messages.DISCUSSION_TIME_ANNOUNCEMENT))
-        await asyncio.sleep(discussion_time)
+        await self._phase_sleep(discussion_time)
 
         # time to accuse and judge people
         await trial_and_judgement_loop(self)
@@ -669,13 +739,31 @@ class MafiaGame:
                 # it's day, so move onto night
                 self.daytime = False
 
+    def _schedule_filling_update(self) -> None:
+        """Schedule a filling-message edit, debounced to roughly one per second.
+
+        Several players joining at once would otherwise produce one edit per
+        join against the same message.
+        """
+        if self._filling_task is None or self._filling_task.done():
+            self._filling_task = asyncio.create_task(self._flush_filling_message())
+
+    async def _flush_filling_message(self) -> None:
+        await asyncio.sleep(1.0)
+        if self._all_players_joined.is_set():
+            # the message is about to be deleted; don't bother
+            return
+        await self._update_filling_message()
+
     async def _update_filling_message(self) -> None:
         assert self.guild is not None
         assert self.all_chat is not None
         assert self.roster is not None
 
-        not_joined = self.participants - set(self.guild.members)
-        text = msg(messages.FILLING_PROGRESS, waiting_on=user_listing(not_joined))
+        text = msg(
+            messages.FILLING_PROGRESS,
+            waiting_on=user_listing(self._remaining_participants.values()),
+        )
 
         if self._filling_message is None:
             self._filling_message = await self.all_chat.send(text)
@@ -689,6 +777,9 @@ class MafiaGame:
         """
         assert self.roster is not None
 
+        if (cached := self._role_listing_cache.get(show_players)) is not None:
+            return cached
+
         def _format_player(player: Player) -> str:
             named_entity = (
                 f"{player}: {player.role.name}" if show_players else player.role.name
@@ -701,10 +792,18 @@ class MafiaGame:
 
             return line
 
-        sorted_players = sorted(
-            self.roster.players, key=lambda player: player.role.name
-        )
-        return "\n".join(map(_format_player, sorted_players))
+        if self._listing_order is None:
+            self._listing_order = sorted(
+                self.roster.players, key=lambda player: player.role.name
+            )
+
+        listing = "\n".join(map(_format_player, self._listing_order))
+        self._role_listing_cache[show_players] = listing
+        return listing
+
+    def _invalidate_role_listing(self) -> None:
+        """Invalidate the cached role listing (called when a player dies)."""
+        self._role_listing_cache.clear()
 
     async def _update_role_listing(self, *, show_players: bool = False) -> None:
         assert self.all_chat is not None
@@ -737,14 +836,16 @@ class MafiaGame:
         for maf in mafia:
             maf.role = role.Mafia
 
-        # assign the rest of the roles
-        wr_roles = list(self.WEIGHTED_ROLES.keys())
-        wr_weights = list(self.WEIGHTED_ROLES.values())
-
-        for townie in roster.townies:
-            chosen_role: Type[Role[Any]] = random.choices(wr_roles, weights=wr_weights)[
-                0
-            ]
+        # assign the rest of the roles with a single batched draw;
+        # random.choices recomputes the cumulative weights on every call, so
+        # draw every townie's role at once
+        townies = list(roster.townies)
+        chosen_roles = random.choices(
+            self._WEIGHTED_ROLE_CHOICES,
+            weights=self._WEIGHTED_ROLE_WEIGHTS,
+            k=len(townies),
+        )
+        for (townie, chosen_role) in zip(townies, chosen_roles):
             townie.role = chosen_role
 
         if all(townie.role is role.Innocent for townie in roster.townies):
@@ -754,28 +855,46 @@ class MafiaGame:
 
         self.log.info("assigned roles: %r", roster)
 
-        # create personal channels for everyone
-        for player in player_set:
-            overwrites: Dict[
-                Union[discord.Role, discord.Member], discord.PermissionOverwrite
-            ] = {
-                self.guild.default_role: BLOCK,
-                self.dead_role: HUSH,
-                # can't overwrite until they join...
-            }
-            channel = await self.category.create_text_channel(
-                name=f"player-{player.id}", overwrites=overwrites,
-            )
-            player.channel = channel
-
-        # create grouped channels for the roles that need it
-        grouped_roles = {player.role for player in player_set if player.role.grouped}
-        for grouped_role in grouped_roles:
-            channel_name = f"{grouped_role.name.lower()}-chat"
-            self.role_chats[grouped_role] = await self.category.create_text_channel(
-                name=channel_name,
-                overwrites={self.guild.default_role: BLOCK, self.dead_role: HUSH},
-            )
+        # every channel created here starts with the same base overwrites;
+        # discord.py only reads the dict when serializing the request, so a
+        # single dict can be shared instead of rebuilding it per channel
+        overwrites: Dict[
+            Union[discord.Role, discord.Member], discord.PermissionOverwrite
+        ] = {
+            self.guild.default_role: BLOCK,
+            self.dead_role: HUSH,
+            # can't overwrite players in until they join...
+        }
+
+        # channel creations only depend on the category existing, so fire
+        # them all concurrently instead of paying one round trip per channel.
+        # the limiter paces them to the observed per-guild channel bucket so
+        # we never trip a 429 and eat its multi-second backoff.
+        limiter = BucketLimiter(2, 5.0)
+
+        async def make_player_channel(player: Player) -> None:
+            async with limiter:
+                player.channel = await self.category.create_text_channel(
+                    name=f"player-{player.id}", overwrites=overwrites,
+                )
+
+        async def make_role_channel(grouped_role: AnyRoleType) -> None:
+            async with limiter:
+                self.role_chats[grouped_role] = await self.category.create_text_channel(
+                    name=f"{grouped_role.name.lower()}-chat", overwrites=overwrites,
+                )
+
+        # roles are final at this point, so this also primes the roster's
+        # by-role index for the rest of the game
+        grouped_roles = [r for r in roster.by_role if r.grouped]
+        await asyncio.gather(
+            *(make_player_channel(player) for player in player_set),
+            *(make_role_channel(grouped_role) for grouped_role in grouped_roles),
+        )
+
+        self._command_channel_ids = {
+            player.channel.id for player in player_set if player.channel is not None
+        } | {channel.id for channel in self.role_chats.values()}
 
         self.log.debug("role_chats: %r", self.role_chats)
 
@@ -789,13 +908,16 @@ class MafiaGame:
             return
 
         self.log.info("we have enough players, setting up game area")
-        await self.lobby_channel.send("setting up game area... just 1 moment...")
+        setup_message = await self.lobby_channel.send(
+            "setting up game area... just 1 moment..."
+        )
         try:
             await self._setup_game_area()
         except Exception as err:
             self.log.exception("failed to setup game area")
-            await self.lobby_channel.send(
-                f"{self.bot.tick(False)} failed to setup game area: `{err}`"
+            # repurpose the notice instead of sending a second message
+            await setup_message.edit(
+                content=f"{self.bot.tick(False)} failed to setup game area: `{err}`"
             )
             return
 
@@ -804,21 +926,41 @@ class MafiaGame:
 
         await self._setup_players_and_roster()
         assert self.roster is not None
-        await self._update_role_listing()
-
-        invite = await self.all_chat.create_invite()
-        self.invite_message = await self.lobby_channel.send(
-            content=msg(
-                messages.LOBBY_INVITE,
-                mentions=mention_set(self.participants),
-                invite=invite,
-            )
+
+        # set up before the invite goes out, so a lightning-fast join can't
+        # observe an empty remaining set
+        self._participant_ids = {member.id for member in self.participants}
+        self._remaining_participants = {
+            member.id: member for member in self.participants
+        }
+
+        # the role listing lives in the game guild and the invite is an
+        # independent create, so overlap the two round trips
+        (_, invite) = await asyncio.gather(
+            self._update_role_listing(), self.all_chat.create_invite()
+        )
+        # the notice has served its purpose once the invite goes out, so
+        # clean it up alongside the send (the invite message is a fresh send
+        # rather than an edit so the mentions actually ping)
+        (self.invite_message, _) = await asyncio.gather(
+            self.lobby_channel.send(
+                content=msg(
+                    messages.LOBBY_INVITE,
+                    mentions=mention_set(self.participants),
+                    invite=invite,
+                )
+            ),
+            setup_message.delete(),
         )
 
         self.state = MafiaGameState.FILLING
         await self._update_filling_message()
         await self._all_players_joined.wait()
 
+        if self._filling_task is not None and not self._filling_task.done():
+            # don't let a pending edit race the deletion below
+            self._filling_task.cancel()
+
         assert self._filling_message is not None
         await self._filling_message.delete()
         await self.roster.localize()
@@ -840,20 +982,49 @@ class MafiaGame:
         await self.game_over()
 
     async def game_over(self) -> None:
-        """Delete the guild after waiting for a bit."""
+        """Announce the end of the game and schedule the teardown.
+
+        The teardown itself happens 15 seconds later in its own task, so the
+        reading time we grant players doesn't keep this coroutine (and the
+        whole ``start()`` chain above it) pinned for the duration.
+        """
         assert self.guild is not None
         assert self.all_chat is not None
 
         await self.all_chat.send(msg(messages.GAME_OVER, seconds=15))
-        await asyncio.sleep(15)
 
-        await self.guild.delete()
+        self.bot.loop.call_later(
+            15, lambda: asyncio.create_task(self._finalize_teardown())
+        )
 
-        try:
-            assert self.invite_message is not None
-            listing = self.role_listing(show_players=True)
-            await self.invite_message.edit(
+    async def _finalize_teardown(self) -> None:
+        """Delete the game guild and point the lobby at the final listing."""
+        assert self.guild is not None
+
+        # the invite edit targets the lobby, not the game guild, so it
+        # doesn't depend on (or rate limit with) the deletion; run both at
+        # once and deal with any edit failure afterwards
+        assert self.invite_message is not None
+        listing = self.role_listing(show_players=True)
+
+        (delete_result, edit_result) = await asyncio.gather(
+            self.guild.delete(),
+            self.invite_message.edit(
                 content=msg(messages.GAME_OVER_INVITE, players=listing)
+            ),
+            return_exceptions=True,
+        )
+        created_guild_ids.discard(self.guild.id)
+
+        if isinstance(delete_result, Exception):
+            self.log.exception(
+                "failed to delete the game guild", exc_info=delete_result
+            )
+
+        # a failed invite edit has always been best-effort
+        if isinstance(edit_result, Exception) and not isinstance(
+            edit_result, discord.HTTPException
+        ):
+            self.log.exception(
+                "failed to edit the invite message", exc_info=edit_result
             )
-        except discord.HTTPException:
-            pass
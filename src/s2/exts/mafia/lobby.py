@@ -2,7 +2,7 @@
 
 __all__ = ["LobbyMenu"]
 
-from typing import Any, cast, TYPE_CHECKING
+from typing import Any, Optional, cast, TYPE_CHECKING
 
 import discord
 import lifesaver
@@ -28,17 +28,24 @@ class LobbyMenu(menus.Menu):  # type: ignore
         self.minimum_players = minimum_players
         self.was_cancelled = False
 
+        #: The lobby embed. The title and author never change, so the same
+        #: embed is mutated and resent instead of being rebuilt per reaction.
+        self._state_embed: Optional[discord.Embed] = None
+
     def _still_needed(self) -> int:
         return self.minimum_players - len(self.game.participants)
 
     def _embed(self) -> discord.Embed:
-        players_listing = user_listing(self.game.participants)
-        embed = discord.Embed(
-            title="Mafia Lobby", description=players_listing, color=discord.Color.red()
-        )
-        embed.set_author(
-            name=str(self.game.creator), icon_url=str(self.game.creator.avatar)
-        )
+        if (embed := self._state_embed) is None:
+            embed = self._state_embed = discord.Embed(
+                title="Mafia Lobby", color=discord.Color.red()
+            )
+            embed.set_author(
+                name=str(self.game.creator), icon_url=str(self.game.creator.avatar)
+            )
+
+        # only the player listing and the footer ever change
+        embed.description = user_listing(self.game.participants)
 
         if (still_needed := self._still_needed()) > 0:
             players = pluralize(player=still_needed, with_indicative=True)
@@ -113,6 +120,10 @@ class LobbyMenu(menus.Menu):  # type: ignore
     on_start_button = menus.Button("\N{WHITE HEAVY CHECK MARK}", action=on_start)
 
     def reaction_check(self, payload: discord.RawReactionActionEvent) -> bool:
+        # this check runs for every reaction the bot sees anywhere, so reject
+        # on the message ID comparison before doing any other work
+        if payload.message_id != self.message.id:
+            return False
         if (member := payload.member) is not None and member.bot:
             return False
-        return payload.message_id == self.message.id and payload.emoji in self.buttons
+        return payload.emoji in self.buttons
@@ -7,10 +7,16 @@ if TYPE_CHECKING:
 
 
 class Key:
+    __slots__ = ("key", "persistent", "_hash")
+
     def __init__(self, key: str, *, persistent: bool = False):
         self.key = key
         self.persistent = persistent
 
+        # keys are hashed on every Memory access, and both fields are fixed
+        # at construction, so compute the hash a single time here
+        self._hash = hash((key, persistent))
+
     @classmethod
     def player(cls, key: str, player: "Player") -> "Key":
         """Create a player-local key."""
@@ -30,7 +36,7 @@ class Key:
         return Key(f"{self.key}_{id}", persistent=self.persistent)
 
     def __hash__(self) -> int:
-        return hash((self.key, self.persistent))
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Key):
@@ -48,6 +54,8 @@ class Memory(Dict[Key, Any]):
     """A mapping used to keep track of player actions."""
 
     def reset(self) -> None:
-        for key in list(self.keys()):
-            if not key.persistent:
-                del self[key]
+        # one C-level clear and bulk update instead of a Python-level delete
+        # per key; the dict itself must survive since games hold onto it
+        persistent = {key: value for (key, value) in self.items() if key.persistent}
+        self.clear()
+        self.update(persistent)
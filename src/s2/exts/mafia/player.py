@@ -1,6 +1,7 @@
 __all__ = ["Player"]
 
-from typing import Optional, Type, Any, TYPE_CHECKING
+import asyncio
+from typing import Awaitable, List, Optional, Type, Any, TYPE_CHECKING
 
 import discord
 
@@ -9,8 +10,12 @@ from .role import Mafia, Investigator
 
 if TYPE_CHECKING:
     from .game import MafiaGame
+    from .memory import Key
     from .role import Role
 
+#: Sentinel for the memory key cache (``None`` is a valid computed value).
+_UNSET: Any = object()
+
 
 class Player:
     """A player in a mafia game."""
@@ -40,6 +45,17 @@ class Player:
 
         self._game = game
 
+        # lazily cached role memory key; roles are stable once the game has
+        # started, so this never needs to be computed more than once
+        self._memory_key: Any = _UNSET
+
+    @property
+    def memory_key(self) -> Optional["Key"]:
+        """Return the memory key for this player's role, computed once."""
+        if self._memory_key is _UNSET:
+            self._memory_key = self.role.localized_key(self)
+        return self._memory_key
+
     @property
     def id(self) -> int:
         """Return the player's ID."""
@@ -68,27 +84,46 @@ class Player:
     async def kill(self) -> None:
         """Kill the player."""
         self.alive = False
+        assert self._game.roster is not None
+        self._game.roster.invalidate_alive()
+        self._game._invalidate_role_listing()
+        self._game._state_changed.set()
+
+        assert self._game.player_role is not None
+        assert self._game.dead_role is not None
+
+        # none of these calls depend on each other, so batch them into one
+        # round trip's worth of waiting instead of serializing them
+        calls: List[Awaitable[Any]] = []
 
         if (channel := self.channel) is not None:
             embed = discord.Embed(title="You died!", color=discord.Color.red())
-            await channel.send(content=self.mention, embed=embed)
+            calls.append(channel.send(content=self.mention, embed=embed))
 
         if self.mafia:
             # prevent speaking in mafia chat
             mafia_chat = self._game.role_chats[Mafia]
             overwrite = discord.PermissionOverwrite(read_messages=True, **HUSH_PERMS)
-            await mafia_chat.set_permissions(self.member, overwrite=overwrite)
+            calls.append(mafia_chat.set_permissions(self.member, overwrite=overwrite))
 
         # prevent speaking everywhere with dead role
-        assert self._game.player_role is not None
-        assert self._game.dead_role is not None
-        await self.member.remove_roles(self._game.player_role)
-        await self.member.add_roles(self._game.dead_role)
+        calls.append(self.member.remove_roles(self._game.player_role))
+        calls.append(self.member.add_roles(self._game.dead_role))
+
+        # the nick edit goes last so it's easy to single out: it has always
+        # been best-effort (the bot can't rename e.g. the guild owner)
+        calls.append(self.member.edit(nick=f"{self.member.name} (dead)"))
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        for result in results[:-1]:
+            if isinstance(result, Exception):
+                raise result
 
-        try:
-            await self.member.edit(nick=f"{self.member.name} (dead)")
-        except discord.HTTPException:
-            pass
+        if isinstance(results[-1], Exception) and not isinstance(
+            results[-1], discord.HTTPException
+        ):
+            raise results[-1]
 
     def __hash__(self) -> int:
         return hash(self.member)
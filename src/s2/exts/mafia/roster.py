@@ -3,9 +3,7 @@
 __all__ = ["Roster"]
 
 import random
-from typing import Callable, Set, Union, Optional, TYPE_CHECKING
-
-import discord
+from typing import Callable, Dict, Set, Union, Optional, TYPE_CHECKING
 
 from . import role
 from .utils import UserLike
@@ -25,15 +23,35 @@ class Roster:
         #: The set of all players.
         self.players = players
 
+        #: Players indexed by member ID, so lookups don't scan the whole set.
+        self._players_by_id: Dict[int, "Player"] = {
+            player.id: player for player in players
+        }
+
+        # Cached role membership sets. Mafia membership is final once roles
+        # have been assigned during game setup, so these only need to be
+        # computed once instead of on every access.
+        self._mafia: Optional[Set["Player"]] = None
+        self._townies: Optional[Set["Player"]] = None
+        self._by_role: Optional[Dict["AnyRoleType", Set["Player"]]] = None
+
+        # Cached aliveness sets. Unlike the role sets these do change during
+        # the game, so Player.kill invalidates them; they're rebuilt at most
+        # once per death instead of once per access.
+        self._alive: Optional[Set["Player"]] = None
+        self._alive_mafia: Optional[Set["Player"]] = None
+        self._alive_townies: Optional[Set["Player"]] = None
+
     def get_player(self, member: Union[int, UserLike]) -> Optional["Player"]:
-        """Get a player from a member."""
-        return discord.utils.find(
-            lambda player: player.id == member or player.member == member, self.players
-        )
+        """Get a player from a member or member ID."""
+        id = member if isinstance(member, int) else member.id
+        return self._players_by_id.get(id)
 
     def sample(self, n: int) -> Set["Player"]:
         """Return a random sample of players."""
-        return set(random.sample(self.players, n))
+        # random.sample no longer accepts sets (3.11+), so materialize the
+        # sequence ourselves exactly once
+        return set(random.sample(list(self.players), n))
 
     async def localize(self) -> None:
         """Localize all players to the game guild."""
@@ -51,14 +69,30 @@ class Roster:
         players = players or self.players
         return set(filter(predicate, players))
 
+    @property
+    def by_role(self) -> Dict["AnyRoleType", Set["Player"]]:
+        """Return the players grouped by role, built once and cached.
+
+        Roles never change after game setup, so the grouping is only
+        computed on first access instead of rescanning the player set.
+        """
+        if self._by_role is None:
+            by_role: Dict["AnyRoleType", Set["Player"]] = {}
+            for player in self.players:
+                by_role.setdefault(player.role, set()).add(player)
+            self._by_role = by_role
+        return self._by_role
+
     def with_role(self, role: "AnyRoleType") -> Set["Player"]:
         """Return the set of players with a role."""
-        return self._filter_players(lambda player: player.role is role)
+        return self.by_role.get(role, set())
 
     @property
     def alive(self) -> Set["Player"]:
         """Return the set of alive players."""
-        return self._filter_players(lambda player: player.alive)
+        if self._alive is None:
+            self._alive = self._filter_players(lambda player: player.alive)
+        return self._alive
 
     @property
     def nocturnal(self) -> Set["Player"]:
@@ -73,34 +107,53 @@ class Roster:
     @property
     def mafia(self) -> Set["Player"]:
         """Return the set of all mafia."""
-        return self._filter_players(lambda player: player.mafia)
+        if self._mafia is None:
+            self._mafia = self._filter_players(lambda player: player.mafia)
+        return self._mafia
 
     @property
     def alive_mafia(self) -> Set["Player"]:
         """Return the set of all currently alive mafia."""
-        return self._filter_players(lambda player: player.alive, self.mafia)
+        if self._alive_mafia is None:
+            self._alive_mafia = self._filter_players(
+                lambda player: player.alive, self.mafia
+            )
+        return self._alive_mafia
 
     @property
     def townies(self) -> Set["Player"]:
         """Return the set of all townies."""
-        return self.players - self.mafia
+        if self._townies is None:
+            self._townies = self.players - self.mafia
+        return self._townies
 
     @property
     def alive_townies(self) -> Set["Player"]:
         """Return the set of all currently alive townies."""
-        return self._filter_players(lambda player: player.alive, self.townies)
+        if self._alive_townies is None:
+            self._alive_townies = self._filter_players(
+                lambda player: player.alive, self.townies
+            )
+        return self._alive_townies
+
+    def invalidate_alive(self) -> None:
+        """Invalidate the cached aliveness sets (called when a player dies)."""
+        self._alive = self._alive_mafia = self._alive_townies = None
 
     def all_mafia_dead(self) -> bool:
         """Return whether all mafia are dead."""
-        return self.alive_mafia == set()
+        return all(player.dead for player in self.mafia)
 
     def all_townies_dead(self) -> bool:
         """Return whether all townies are dead."""
-        return self.alive_townies == set()
+        return all(player.dead for player in self.townies)
 
     def add(self, player: "Player") -> None:
         """Add a player to the set of players."""
         self.players.add(player)
+        self._players_by_id[player.id] = player
+        self._mafia = self._townies = self._by_role = None
+        self.invalidate_alive()
 
     def __repr__(self) -> str:
         return f"<Roster players={self.players!r}>"
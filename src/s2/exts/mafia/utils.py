@@ -3,14 +3,16 @@
 __all__ = [
     "UserLike",
     "UserLikeIterable",
+    "BucketLimiter",
     "basic_command",
     "select_player",
 ]
 
-from typing import Union, Iterable, Optional, Set, TYPE_CHECKING
+import asyncio
+from typing import Any, Union, Iterable, Optional, Set, TYPE_CHECKING
 
 import discord
-import fuzzywuzzy.process as fw_process
+import rapidfuzz.process as rf_process
 
 if TYPE_CHECKING:
     from .player import Player
@@ -19,33 +21,60 @@ UserLike = Union[discord.User, discord.Member]
 UserLikeIterable = Iterable[UserLike]
 
 
+class BucketLimiter:
+    """An async context manager that paces requests to ``rate`` per ``per`` seconds.
+
+    Discord punishes bursts against a route's bucket with 429s that stall
+    everything behind them; pacing requests up front keeps throughput smooth
+    instead.
+    """
+
+    def __init__(self, rate: int, per: float) -> None:
+        self._semaphore = asyncio.Semaphore(rate)
+        self._per = per
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+
+    async def __aexit__(self, *args: Any) -> None:
+        # return the token only once the window has passed
+        asyncio.get_event_loop().call_later(self._per, self._semaphore.release)
+
+
 def basic_command(name: str, input: str) -> Optional[str]:
     """Parse a basic command."""
-    name += " "
-
+    # checked in two steps so the common non-command case bails without
+    # building a new "name plus space" string first
     if not input.startswith(name):
         return None
-    return input[len(name) :]
+
+    rest = input[len(name) :]
+    if not rest.startswith(" "):
+        return None
+    return rest[1:]
 
 
 def select_player(selector: str, players: Set["Player"]) -> Optional["Player"]:
     """Select a player from a set of players using a selector."""
-    direct_match = discord.utils.find(
-        lambda player: str(player.member.name).lower() == selector.lower()
-        or str(player.member).lower() == selector.lower()
-        or str(player.member.id) == selector
-        or player.mention == selector,
-        players,
-    )
+    selector_lower = selector.lower()
 
-    if direct_match is not None:
-        return direct_match
+    for player in players:
+        if (
+            str(player.member.name).lower() == selector_lower
+            or str(player.member).lower() == selector_lower
+            or str(player.member.id) == selector
+            or player.mention == selector
+        ):
+            return player
 
-    mapping = {player.id: player.member.name for player in players}
-    selected_id: int
-    _, score, selected_id = fw_process.extractOne(selector, mapping)
+    by_id = {player.id: player for player in players}
+    mapping = {id: player.member.name for (id, player) in by_id.items()}
 
-    if score > 50:  # arbitrary threshold
-        return discord.utils.find(lambda player: player.id == selected_id, players)
+    # the cutoff (an arbitrary threshold) is applied inside the C scorer,
+    # so hopeless candidates short-circuit without a full score
+    result = rf_process.extractOne(selector, mapping, score_cutoff=50)
+    if result is None:
+        return None
 
-    return None
+    (_, _, selected_id) = result
+    return by_id.get(selected_id)
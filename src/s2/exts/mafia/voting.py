@@ -3,16 +3,16 @@ __all__ = ["Votes", "Voting", "trial_and_judgement_loop", "Spotlight"]
 import asyncio
 import enum
 import collections
-import math
 from typing import (
     Any,
+    Counter,
     Dict,
     Callable,
     Awaitable,
     Generic,
     DefaultDict,
     Tuple,
-    List,
+    Set,
     Optional,
     TYPE_CHECKING,
     TypeVar,
@@ -33,6 +33,16 @@ if TYPE_CHECKING:
 VT = TypeVar("VT")
 VR = TypeVar("VR")
 
+# hoisted out of the per-message handlers so they aren't rebuilt on every
+# incoming message
+_INNOCENT_COMMANDS = frozenset({"!innocent", "!inno", "!i"})
+_GUILTY_COMMANDS = frozenset({"!guilty", "!g"})
+
+# VOTES_ENTRY is a plain template with no flavor variants, and it's expanded
+# once per affected target on every vote, so bind its formatter directly
+# instead of dispatching through msg()
+_format_votes_entry = messages.VOTES_ENTRY.format
+
 
 class Judgement(enum.Enum):
     GUILTY = enum.auto()
@@ -51,61 +61,96 @@ class Judgement(enum.Enum):
 
 class Votes(Generic[VR, VT]):
     def __init__(self) -> None:
-        self.votes: DefaultDict[VT, List[VR]] = collections.defaultdict(list)
+        self.votes: DefaultDict[VT, Set[VR]] = collections.defaultdict(set)
+
+        #: A reverse index of voters to their targets, so that looking up a
+        #: voter's vote doesn't have to scan every target's voter list.
+        self._voter_targets: Dict[VR, VT] = {}
+
+        #: A running tally of votes per target, maintained as votes come in
+        #: so that tallying doesn't have to rebuild a dict from the lists.
+        self._tallies: Counter[VT] = collections.Counter()
 
     def tallied(self) -> Dict[VT, int]:
         """Return the votes, but tallied up instead of lists of voters."""
-        return {target: len(votes) for target, votes in self.votes.items()}
+        return dict(self._tallies)
+
+    def count(self, target: VT) -> int:
+        """Return the number of votes for a single target."""
+        return self._tallies[target]
 
     def sorted_tallies(
         self, descending: bool = True
     ) -> "collections.OrderedDict[VT, int]":
         """Return the tallied votes, defaulting to descending order."""
-        sorted_tallies = sorted(
-            self.tallied().items(), key=lambda item: item[1], reverse=descending
-        )
+        sorted_tallies = self._tallies.most_common()
+        if not descending:
+            sorted_tallies.reverse()
         return collections.OrderedDict(sorted_tallies)
 
     def sorted(
         self, *, descending: bool = True
-    ) -> "collections.OrderedDict[VT, List[VR]]":
+    ) -> "collections.OrderedDict[VT, Set[VR]]":
         """Return the votes as an ordered dictionary. """
         sorted_items = sorted(
             self.votes.items(), key=lambda item: len(item[1]), reverse=descending
         )
         return collections.OrderedDict(sorted_items)
 
+    def leader(self) -> Optional[Tuple[VT, int]]:
+        """Return the target with the most votes and their tally.
+
+        ``None`` is returned if nobody has voted or if the lead is tied.
+        """
+        best: Optional[VT] = None
+        best_count = second_count = 0
+
+        for (target, count) in self._tallies.items():
+            if count > best_count:
+                best, best_count, second_count = target, count, best_count
+            elif count > second_count:
+                second_count = count
+
+        if best is None or best_count == second_count:
+            return None
+        return (best, best_count)
+
     def get_vote(self, voter: VR) -> Optional[VT]:
         """Return who a voter voted for.
 
         The the voter hasn't voted for someone yet, ``None`` is returned.
         """
-        if (
-            vote := discord.utils.find(
-                lambda item: voter in item[1], self.votes.items()
-            )
-        ) is not None:
-            return vote[0]
-        return None
+        return self._voter_targets.get(voter)
 
     def add_vote(self, voter: VR, target: VT) -> None:
         """Add a voter's vote for someone.
 
         Raises if the voter has already voted.
         """
-        if self.get_vote(voter) is not None:
+        if voter in self._voter_targets:
             raise ValueError(f"{voter!r} has already voted")
-        self.votes[target].append(voter)
+        self.votes[target].add(voter)
+        self._voter_targets[voter] = target
+        self._tallies[target] += 1
 
     def cancel_vote(self, voter: VR) -> None:
         """Remove a voter's vote for someone.
 
         Raises if the voter hasn't voted yet.
         """
-        if (vote := self.get_vote(voter)) is None:
+        if (vote := self._voter_targets.pop(voter, None)) is None:
             raise KeyError(repr(voter))
 
         self.votes[vote].remove(voter)
+        self._tallies[vote] -= 1
+        if not self._tallies[vote]:
+            del self._tallies[vote]
+
+    def clear(self) -> None:
+        """Remove all votes, in place."""
+        self.votes.clear()
+        self._voter_targets.clear()
+        self._tallies.clear()
 
 
 class Spotlight:
@@ -136,6 +181,14 @@ class Voting:
         self.trial_votes = Votes["Player", "Player"]()
         self.judgement_votes: Dict["Player", Judgement] = {}
 
+        #: The pending tally announcement, if any. Tally updates are coalesced
+        #: through this task so that vote spam can't flood the channel.
+        self._tally_task: Optional["asyncio.Task[None]"] = None
+
+        #: Rendered tally lines per target. Only the targets affected by a
+        #: vote have their lines re-rendered, instead of the whole board.
+        self._vote_lines: Dict["Player", str] = {}
+
     # properties {{{
 
     @property
@@ -166,8 +219,15 @@ class Voting:
     def _msg_trial_time_remaining(self, seconds: int) -> str:
         return msg(messages.VOTING_TIME_REMAINING, seconds=seconds)
 
-    def _msg_voted_for(self, voter: "Player", target: "Player") -> str:
-        return msg(messages.VOTED_FOR, voter=voter, target=target)
+    def _refresh_vote_line(self, target: "Player") -> None:
+        """Re-render the cached tally line for a single target."""
+        count = self.trial_votes.count(target)
+        if count:
+            self._vote_lines[target] = _format_votes_entry(
+                votes=count, mention=target.mention
+            )
+        else:
+            self._vote_lines.pop(target, None)
 
     def _format_sorted_tallies(self, votes: Votes["Player", "Player"]) -> str:
         sorted_tallies = votes.sorted_tallies()
@@ -175,7 +235,9 @@ class Voting:
 
         def format_item(item: Tuple["Player", int]) -> str:
             target, votes = item
-            formatted = msg(messages.VOTES_ENTRY, votes=votes, mention=target.mention)
+            formatted = self._vote_lines.get(target) or _format_votes_entry(
+                votes=votes, mention=target.mention
+            )
             if votes == highest_tally:
                 formatted = f"**{formatted}**"
             return formatted
@@ -215,15 +277,19 @@ class Voting:
         """Handle incoming messages from alive players."""
 
         def _check(msg: discord.Message) -> bool:
+            # this runs for every message the bot sees, so reject on the
+            # cheap predicates before resolving the author to a player
+            if msg.author.bot:
+                return False
+            if not private and msg.channel is not self.all_chat:
+                return False
             if (player := self.roster.get_player(msg.author)) is None:
                 return False
             if player.dead:
                 return False
-            return (
-                (msg.guild is None or msg.channel == player.channel)
-                if private
-                else msg.channel == self.all_chat
-            )
+            if private:
+                return msg.guild is None or msg.channel == player.channel
+            return True
 
         async def _wrapper_handler(msg: discord.Message) -> None:
             player = self.roster.get_player(msg.author)
@@ -239,7 +305,7 @@ class Voting:
     # trial {{{
 
     def trial_votes_required(self) -> int:
-        return max(math.floor(len(self.roster.alive) / 3), 2)
+        return max(len(self.roster.alive) // 3, 2)
 
     async def _process_trial_vote(self, msg: discord.Message, player: "Player") -> None:
         selector = basic_command("!vote", msg.content)
@@ -258,15 +324,25 @@ class Voting:
                 await self.all_chat.send(self._msg_already_voted(player, target))
                 return
             self.trial_votes.cancel_vote(player)
+            self._refresh_vote_line(previous_target)
 
         self.trial_votes.add_vote(player, target)
+        self._refresh_vote_line(target)
+        self._schedule_tally_update()
 
-        update_content = (
-            self._msg_voted_for(player, target)
-            + "\n\n"
-            + self._format_sorted_tallies(self.trial_votes)
-        )
-        await self.all_chat.send(update_content)
+    def _schedule_tally_update(self) -> None:
+        """Schedule a tally announcement, debounced to roughly one per second.
+
+        Announcing after every single ``!vote`` sends one message per vote
+        change, which runs straight into the per-channel rate limit when
+        people switch votes rapidly.
+        """
+        if self._tally_task is None or self._tally_task.done():
+            self._tally_task = self.game.bot.loop.create_task(self._flush_tally())
+
+    async def _flush_tally(self) -> None:
+        await asyncio.sleep(1.0)
+        await self.all_chat.send(self._format_sorted_tallies(self.trial_votes))
 
     async def trial_voting(self) -> Optional["Player"]:
         """Go through voting time to put someone on trial."""
@@ -279,18 +355,14 @@ class Voting:
             time_remaining_message=messages.VOTING_TIME_REMAINING,
         )
 
-        sorted_tallies = self.trial_votes.sorted_tallies()
+        if self._tally_task is not None and not self._tally_task.done():
+            self._tally_task.cancel()
 
-        if not sorted_tallies:
-            # no votes happened?
+        if (leader := self.trial_votes.leader()) is None:
+            # no votes happened, or there was a tie
             return None
 
-        st_items = list(sorted_tallies.items())
-        highest_target, highest_votes = st_items[0]
-
-        if list(sorted_tallies.values()).count(highest_votes) > 1:
-            # tie
-            return None
+        highest_target, highest_votes = leader
 
         if highest_votes < self.trial_votes_required():
             # not enough votes
@@ -309,9 +381,9 @@ class Voting:
             # wasn't placed in the original voting map; ignore
             return
 
-        if message.content in {"!innocent", "!inno", "!i"}:
+        if message.content in _INNOCENT_COMMANDS:
             vote = Judgement.INNOCENT
-        elif message.content in {"!guilty", "!g"}:
+        elif message.content in _GUILTY_COMMANDS:
             vote = Judgement.GUILTY
         else:
             return
@@ -427,8 +499,9 @@ class Voting:
                     )
                 await asyncio.sleep(5)
 
-            self.trial_votes = Votes()
-            self.judgement_votes = {}
+            self.trial_votes.clear()
+            self.judgement_votes.clear()
+            self._vote_lines.clear()
 
             trials += 1
 